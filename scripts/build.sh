@@ -7,7 +7,9 @@
 #   --debug          Build with debug symbols
 #   --release        Build optimized release (default)
 #   --clean          Clean build directory before building
+#   --reconfigure    Re-run meson setup on an existing build directory
 #   --verbose        Show detailed build output
+#   --jobs N         Number of parallel compile jobs (default: ninja's choice)
 #
 
 set -e
@@ -22,7 +24,9 @@ export PKG_CONFIG_PATH="$PROJECT_ROOT/pkgconfig:$PKG_CONFIG_PATH"
 # Default options
 BUILD_TYPE="release"
 CLEAN_BUILD=false
+RECONFIGURE=false
 VERBOSE=false
+JOBS=""
 
 # Parse command-line arguments
 while [[ $# -gt 0 ]]; do
@@ -39,10 +43,18 @@ while [[ $# -gt 0 ]]; do
       CLEAN_BUILD=true
       shift
       ;;
+    --reconfigure)
+      RECONFIGURE=true
+      shift
+      ;;
     --verbose)
       VERBOSE=true
       shift
       ;;
+    -j|--jobs)
+      JOBS="$2"
+      shift 2
+      ;;
     *)
       echo "Unknown option: $1"
       exit 1
@@ -50,6 +62,14 @@ while [[ $# -gt 0 ]]; do
   esac
 done
 
+# ThinLTO (per-function optimization, cacheable across links) only pays
+# off for release builds; debug builds link without it
+if [ "$BUILD_TYPE" = "release" ]; then
+  LTO_ARGS="-Db_lto=true -Db_lto_mode=thin"
+else
+  LTO_ARGS="-Db_lto=false"
+fi
+
 # Print header
 echo "=========================================="
 echo "Video Looper - Build Script"
@@ -81,7 +101,7 @@ if [ ! -f "$PROJECT_ROOT/build/meson-private/coredata.dat" ]; then
   echo "Configuring Meson build system..."
   cd "$PROJECT_ROOT"
 
-  MESON_ARGS="--buildtype=$BUILD_TYPE"
+  MESON_ARGS="--buildtype=$BUILD_TYPE --backend=ninja $LTO_ARGS"
 
   if [ "$VERBOSE" = true ]; then
     MESON_ARGS="$MESON_ARGS --debug"
@@ -89,16 +109,26 @@ if [ ! -f "$PROJECT_ROOT/build/meson-private/coredata.dat" ]; then
 
   meson setup build $MESON_ARGS
   echo ""
+elif [ "$RECONFIGURE" = true ]; then
+  echo "Reconfiguring existing Meson build directory..."
+  cd "$PROJECT_ROOT"
+  meson setup --reconfigure build --buildtype=$BUILD_TYPE $LTO_ARGS
+  echo ""
 fi
 
 # Compile the project
 echo "Compiling project..."
 cd "$PROJECT_ROOT/build"
 
+NINJA_ARGS=""
+if [ -n "$JOBS" ]; then
+  NINJA_ARGS="-j $JOBS"
+fi
+
 if [ "$VERBOSE" = true ]; then
-  ninja -v
+  ninja -v $NINJA_ARGS
 else
-  ninja
+  ninja $NINJA_ARGS
 fi
 
 echo ""
@@ -24,9 +24,11 @@
 
 #include <gst/gst.h>
 #include <gst/gstmacos.h>
+#include <limits.h>
 #include <signal.h>
 #include <stdio.h>
 #include <stdlib.h>
+#include <unistd.h>
 
 #include "app/app_context.h"
 #include "app/app_error.h"
@@ -50,6 +52,7 @@ static void on_app_error(AppError *error, gpointer user_data);
 static gboolean initialize_app_context(AppContext **app_ctx);
 static gboolean setup_event_loop(AppContext *app_ctx);
 static void install_signal_handlers(void);
+static void notify_signal_readiness(void);
 static gboolean initialize_components(AppContext *app_ctx);
 static void cleanup_components(AppContext *app_ctx);
 
@@ -215,6 +218,33 @@ static void install_signal_handlers(void)
     LOG_INFO("Signal handlers installed");
 }
 
+/**
+ * Report signal-handler readiness to a launching test harness
+ *
+ * If READY_FD names an inherited file descriptor, writes one byte to it and
+ * closes it, so signal tests can start signalling as soon as the handlers
+ * are in place instead of sleeping. Does nothing when READY_FD is unset.
+ */
+static void notify_signal_readiness(void)
+{
+    const char *ready_fd_env = getenv("READY_FD");
+    if (!ready_fd_env) {
+        return;
+    }
+
+    char *end = NULL;
+    long ready_fd = strtol(ready_fd_env, &end, 10);
+    if (end == ready_fd_env || *end != '\0' || ready_fd < 0 || ready_fd > INT_MAX) {
+        LOG_WARNING("Ignoring invalid READY_FD value: %s", ready_fd_env);
+        return;
+    }
+
+    if (write((int) ready_fd, "R", 1) != 1) {
+        LOG_WARNING("Failed to write readiness byte to READY_FD %ld", ready_fd);
+    }
+    close((int) ready_fd);
+}
+
 /**
  * Initialize component: camera source
  *
@@ -660,6 +690,7 @@ static int app_main(int argc, char *argv[], gpointer user_data)
 
     /* Install signal handlers */
     install_signal_handlers();
+    notify_signal_readiness();
 
     /* Initialize all application components (including NSWindow on main thread) */
     if (!initialize_components(app_ctx)) {
@@ -698,7 +729,9 @@ static int app_main(int argc, char *argv[], gpointer user_data)
     }
     LOG_INFO("Pipeline started - live video should be visible");
 
-    /* Run main event loop on main thread */
+    /* Run main event loop on main thread
+     * The "application ready" line is the readiness signal for E2E launch tests */
+    LOG_INFO("Event loop starting, application ready");
     LOG_DEBUG("Starting main event loop...");
     g_main_loop_run(app_ctx->main_loop);
     LOG_DEBUG("Main event loop exited");
@@ -0,0 +1,204 @@
+"""
+Content-hash cache of source-file scan results for the E2E checks.
+
+The camera and grid tests answer their questions by scanning C sources.
+Between runs those sources rarely change, so each check's result is stored
+in .pytest_scan_cache.json at the project root under the file's path,
+together with the SHA-1 of the bytes it was computed from. A warm run only
+hashes the files; the scan itself runs again only when a file's contents
+change, and the results for the old contents are dropped at that point.
+A result also depends on the check that produced it (its pattern, needle
+or threshold), so the whole cache is discarded whenever a test module in
+this directory changes.
+
+The helpers the checks share for finding and reading those sources live
+here too: source_exists() answers from one directory listing per directory
+and map_source() maps each file read-only once per process.
+
+The cache is loaded lazily on first use and written back once at interpreter
+exit, so it works the same under pytest and when a test module is run
+directly (as run_e2e_tests.py does).
+"""
+
+import atexit
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+
+CACHE_FILE = Path(__file__).parent.parent.parent / ".pytest_scan_cache.json"
+
+# The checks are defined in the test modules; stored results are only
+# trusted if neither they nor this module changed since they were written
+_CHECKS_SHA1 = hashlib.sha1()
+for _module in sorted(Path(__file__).parent.glob("test_*.py")) + [Path(__file__)]:
+    _CHECKS_SHA1.update(_module.read_bytes())
+CHECKS_DIGEST = _CHECKS_SHA1.hexdigest()
+
+_lock = threading.Lock()
+_stored: dict | None = None  # The cache file as loaded on first use
+_entries: dict = {}  # Paths checked in this run: {"digest": ..., "results": {...}}
+_dirty = False
+
+
+@lru_cache(maxsize=None)
+def file_digest(path: Path) -> str:
+    """
+    SHA-1 of a file's bytes, hashed straight from a read-only mapping.
+
+    Returns:
+        Hex digest, or "" if the file does not exist
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return ""
+    try:
+        if os.fstat(fd).st_size == 0:
+            # Zero-length files cannot be mapped
+            return hashlib.sha1(b"").hexdigest()
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha1(mm).hexdigest()
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=None)
+def _dir_contents(directory: Path) -> frozenset:
+    """
+    Names of the regular files in a directory, listed once per process.
+
+    One scandir per source directory answers every existence check,
+    rather than a stat() per file.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except FileNotFoundError:
+        return frozenset()
+
+
+def source_exists(path: Path) -> bool:
+    """Whether a source file exists, answered from its directory listing."""
+    return path.name in _dir_contents(path.parent)
+
+
+@lru_cache(maxsize=None)
+def map_source(path: Path):
+    """
+    Map a source file read-only once per process; several tests inspect the same file.
+
+    The C sources are plain ASCII, so checks search the mapping with bytes
+    needles rather than decoding the whole file to str first.
+
+    Returns:
+        Read-only mmap of the file, or b"" if the file is missing or empty
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return b""
+    try:
+        if os.fstat(fd).st_size == 0:
+            # Zero-length files cannot be mapped
+            return b""
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+
+def _read_cache_file() -> dict:
+    """Load the on-disk cache, treating a missing, corrupt or stale file as empty."""
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("checks") != CHECKS_DIGEST:
+        return {}
+    entries = cache.get("files")
+    if not isinstance(entries, dict):
+        return {}
+    return {name: entry for name, entry in entries.items() if _is_entry(entry)}
+
+
+def _is_entry(entry) -> bool:
+    """Whether a loaded value has the shape of a cache entry."""
+    return isinstance(entry, dict) and isinstance(entry.get("digest"), str) \
+        and isinstance(entry.get("results"), dict)
+
+
+def cached_check(path: Path, key: str, scan_fn: Callable[[], object]):
+    """
+    Return the cached result of check `key` for the current contents of path.
+
+    scan_fn runs only when this file content has no stored result for key;
+    its return value must be JSON-serializable.
+    """
+    global _stored, _dirty
+
+    name = os.path.relpath(path, CACHE_FILE.parent)
+    digest = file_digest(path)
+    with _lock:
+        if _stored is None:
+            _stored = _read_cache_file()
+        entry = _entries.get(name)
+        if entry is None:
+            # Stored results only carry over while the contents are the same
+            stored = _stored.get(name)
+            results = dict(stored["results"]) \
+                if stored is not None and stored["digest"] == digest else {}
+            entry = _entries[name] = {"digest": digest, "results": results}
+        results = entry["results"]
+        if key in results:
+            return results[key]
+
+    value = scan_fn()
+    with _lock:
+        results[key] = value
+        _dirty = True
+    return value
+
+
+@atexit.register
+def _save() -> None:
+    """
+    Merge this run's results into the cache file with an atomic replace.
+
+    Paths checked in this run keep only the entry for their current
+    contents. Another test module may have written the file since we loaded
+    it, so its paths are kept, unless the file they name no longer exists.
+    """
+    if not _dirty:
+        return
+
+    merged = {name: entry for name, entry in _read_cache_file().items()
+              if (CACHE_FILE.parent / name).exists()}
+    for name, entry in _entries.items():
+        other = merged.get(name)
+        if other is not None and other["digest"] == entry["digest"]:
+            other["results"].update(entry["results"])
+        else:
+            merged[name] = entry
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_FILE.parent, suffix=".tmp")
+    except OSError:
+        # A read-only checkout just runs without a warm cache
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"checks": CHECKS_DIGEST, "files": merged}, f, sort_keys=True)
+        os.replace(tmp_path, CACHE_FILE)
+    except OSError:
+        # Don't leave a partial temp file behind
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
@@ -8,16 +8,25 @@ This script runs:
 2. Camera permission handling tests
 3. Grid display verification tests
 
+Test modules are independent, so they run concurrently; each module's
+output is buffered and printed in order once all have finished.
+
 Usage:
     python3 test/e2e/run_e2e_tests.py
 
+Environment:
+    E2E_SEQUENTIAL=1  Run test modules one at a time (useful for debugging)
+
 Exit Codes:
     0 = All tests passed
     1 = One or more tests failed
 """
 
+import io
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -78,19 +87,26 @@ def main() -> int:
     overall_failed = 0
     test_results = []
 
-    # Run each test module
+    # Run each test module (concurrently unless E2E_SEQUENTIAL is set)
+    available = []
     for test_file in test_modules:
         if not test_file.exists():
             print(f"✗ SKIP: {test_file.name} not found")
             overall_failed += 1
-            continue
+        else:
+            available.append(test_file)
 
+    if os.environ.get("E2E_SEQUENTIAL") or len(available) < 2:
+        outcomes = [run_test_module(test_file) for test_file in available]
+    else:
+        with ThreadPoolExecutor(max_workers=len(available)) as executor:
+            outcomes = list(executor.map(run_test_module, available))
+
+    for test_file, (exit_code, output) in zip(available, outcomes):
         print(f"\n{'=' * 80}")
         print(f"Running: {test_file.name}")
         print("=" * 80)
 
-        exit_code, output = run_test_module(test_file)
-
         # Parse test results from output
         test_name = test_file.stem
         status = "PASS" if exit_code == 0 else "FAIL"
@@ -104,33 +120,32 @@ def main() -> int:
         # Print test output
         print(output)
 
-    # Print summary report
-    print("\n" + "=" * 80)
-    print("E2E TEST SUMMARY REPORT")
-    print("=" * 80)
-    print()
+    # Print summary report (assembled first, written once)
+    report = io.StringIO()
+    report.write("\n" + "=" * 80 + "\n")
+    report.write("E2E TEST SUMMARY REPORT\n")
+    report.write("=" * 80 + "\n\n")
 
     for test_name, status in test_results:
         symbol = "✓" if status == "PASS" else "✗"
-        print(f"{symbol} {test_name}: {status}")
+        report.write(f"{symbol} {test_name}: {status}\n")
 
-    print()
-    print(f"Total Tests Run: {overall_passed + overall_failed}")
-    print(f"Tests Passed: {overall_passed}")
-    print(f"Tests Failed: {overall_failed}")
-    print()
-    print(f"End Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    report.write("\n")
+    report.write(f"Total Tests Run: {overall_passed + overall_failed}\n")
+    report.write(f"Tests Passed: {overall_passed}\n")
+    report.write(f"Tests Failed: {overall_failed}\n\n")
+    report.write(f"End Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
     if overall_failed == 0:
-        print()
-        print("✓ ALL E2E TESTS PASSED")
-        print("=" * 80)
-        return 0
+        report.write("✓ ALL E2E TESTS PASSED\n")
     else:
-        print()
-        print("✗ SOME E2E TESTS FAILED")
-        print("=" * 80)
-        return 1
+        report.write("✗ SOME E2E TESTS FAILED\n")
+    report.write("=" * 80 + "\n")
+
+    sys.stdout.write(report.getvalue())
+    sys.stdout.flush()
+
+    return 0 if overall_failed == 0 else 1
 
 
 if __name__ == "__main__":
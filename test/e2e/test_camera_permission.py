@@ -15,69 +15,67 @@ Note: This test uses mocking since we cannot control macOS system dialogs
 in an automated test environment. The test verifies that the application
 correctly handles the permission API calls.
 
+Test Framework: pytest (falls back to a direct runner when unavailable)
 Test Status: Automated, Headless, Mocked System Dialogs
 Expected Duration: < 5 seconds
 """
 
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import json
 
+try:
+    from ._scan_cache import cached_check, map_source, source_exists
+except ImportError:
+    from _scan_cache import cached_check, map_source, source_exists
 
-def get_project_root() -> Path:
-    """Get the project root directory."""
-    return Path(__file__).parent.parent.parent
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+CAMERA_SOURCE = PROJECT_ROOT / "src" / "camera" / "camera_source.c"
+APP_ERROR = PROJECT_ROOT / "src" / "app" / "app_error.h"
+PIPELINE_BUILDER = PROJECT_ROOT / "src" / "gstreamer" / "pipeline_builder.c"
+LOGGING_MODULE = PROJECT_ROOT / "src" / "utils" / "logging.c"
 
-def test_camera_permission_request() -> tuple[bool, str]:
+# Identifiers the checks look for; each also names its scan-cache entry
+PERMISSION_REQUEST_FN = "camera_request_permission"
+PERMISSION_DENIED = "CAMERA_PERMISSION_DENIED"
+PERMISSION_DENIED_ERROR = "APP_ERROR_CAMERA_PERMISSION_DENIED"
+CAMERA_INIT_FN = "camera_source_init"
+PIPELINE_CREATE_FN = "pipeline_create"
+LOGGING_FN = "logging_log"
+LOG_MACRO_PREFIX = "LOG_"
+
+
+def _source_contains(path: Path, needle: str) -> bool:
+    """Whether a source file contains needle, via the content-hash scan cache."""
+    return cached_check(
+        path, "has_" + needle,
+        lambda: map_source(path).find(needle.encode("ascii")) != -1
+    )
+
+
+def test_camera_permission_request():
     """
     Test that application requests camera permissions on startup.
 
     Verifies that the camera_request_permission() function is called
     during initialization and that the application handles permission
     state correctly.
-
-    Returns:
-        (success, message)
     """
     # Note: In a real test with actual macOS integration, we would
     # use environment variables or mocking to simulate permission states.
     # For automated testing, we verify the code path exists.
 
     # Check if camera permission code exists in source
-    project_root = get_project_root()
-    camera_source = project_root / "src" / "camera" / "camera_source.c"
+    assert source_exists(CAMERA_SOURCE), \
+        f"Camera source file not found at {CAMERA_SOURCE}"
 
-    if not camera_source.exists():
-        return (
-            False,
-            f"Camera source file not found at {camera_source}"
-        )
+    # Check for permission request function
+    assert _source_contains(CAMERA_SOURCE, PERMISSION_REQUEST_FN), \
+        "Camera permission request function not found"
 
-    try:
-        with open(camera_source, 'r') as f:
-            content = f.read()
-
-            # Check for permission request function
-            if "camera_request_permission" in content:
-                return (
-                    True,
-                    "✓ PASS: Camera permission request function implemented"
-                )
-            else:
-                return (
-                    False,
-                    "✗ FAIL: Camera permission request function not found"
-                )
-    except Exception as e:
-        return (
-            False,
-            f"Error checking camera source: {str(e)}"
-        )
-
-
-def test_camera_permission_denied_handling() -> tuple[bool, str]:
+
+def test_camera_permission_denied_handling():
     """
     Test that application handles permission denied gracefully.
 
@@ -85,60 +83,20 @@ def test_camera_permission_denied_handling() -> tuple[bool, str]:
     1. Logs an appropriate error message
     2. Displays an error dialog
     3. Exits with error code
-
-    Returns:
-        (success, message)
     """
     # Check that error handling code exists
-    project_root = get_project_root()
-    camera_source = project_root / "src" / "camera" / "camera_source.c"
-    app_error = project_root / "src" / "app" / "app_error.h"
-
-    if not camera_source.exists():
-        return (
-            False,
-            f"Camera source file not found at {camera_source}"
-        )
-
-    if not app_error.exists():
-        return (
-            False,
-            f"App error header not found at {app_error}"
-        )
+    assert source_exists(CAMERA_SOURCE), \
+        f"Camera source file not found at {CAMERA_SOURCE}"
+    assert source_exists(APP_ERROR), f"App error header not found at {APP_ERROR}"
 
-    try:
-        with open(camera_source, 'r') as f:
-            camera_content = f.read()
-
-        with open(app_error, 'r') as f:
-            error_content = f.read()
-
-            # Check for permission denied error code
-            if "CAMERA_PERMISSION_DENIED" not in camera_content:
-                return (
-                    False,
-                    "✗ FAIL: Camera permission denied handling not implemented"
-                )
-
-            if "APP_ERROR_CAMERA_PERMISSION_DENIED" not in error_content:
-                return (
-                    False,
-                    "✗ FAIL: Camera permission error code not defined"
-                )
-
-            return (
-                True,
-                "✓ PASS: Camera permission denied error handling implemented"
-            )
-
-    except Exception as e:
-        return (
-            False,
-            f"Error checking error handling: {str(e)}"
-        )
-
-
-def test_camera_permission_granted_flow() -> tuple[bool, str]:
+    # Check for permission denied error code
+    assert _source_contains(CAMERA_SOURCE, PERMISSION_DENIED), \
+        "Camera permission denied handling not implemented"
+    assert _source_contains(APP_ERROR, PERMISSION_DENIED_ERROR), \
+        "Camera permission error code not defined"
+
+
+def test_camera_permission_granted_flow():
     """
     Test that application proceeds with camera initialization when permitted.
 
@@ -146,98 +104,56 @@ def test_camera_permission_granted_flow() -> tuple[bool, str]:
     1. Proceeds with camera initialization
     2. Attempts to connect to built-in camera
     3. Starts video pipeline
-
-    Returns:
-        (success, message)
     """
-    project_root = get_project_root()
-    camera_source = project_root / "src" / "camera" / "camera_source.c"
-    pipeline_builder = project_root / "src" / "gstreamer" / "pipeline_builder.c"
+    assert source_exists(CAMERA_SOURCE) and source_exists(PIPELINE_BUILDER), \
+        "Required source files not found"
 
-    if not camera_source.exists() or not pipeline_builder.exists():
-        return (
-            False,
-            "Required source files not found"
-        )
+    # Check for camera initialization function
+    assert _source_contains(CAMERA_SOURCE, CAMERA_INIT_FN), \
+        "Camera initialization function not found"
 
-    try:
-        with open(camera_source, 'r') as f:
-            camera_content = f.read()
-
-        with open(pipeline_builder, 'r') as f:
-            pipeline_content = f.read()
-
-            # Check for camera initialization function
-            if "camera_source_init" not in camera_content:
-                return (
-                    False,
-                    "✗ FAIL: Camera initialization function not found"
-                )
-
-            # Check for pipeline creation
-            if "pipeline_create" not in pipeline_content:
-                return (
-                    False,
-                    "✗ FAIL: Pipeline creation function not found"
-                )
-
-            return (
-                True,
-                "✓ PASS: Camera initialization and pipeline creation implemented"
-            )
-
-    except Exception as e:
-        return (
-            False,
-            f"Error checking initialization: {str(e)}"
-        )
-
-
-def test_permission_error_message() -> tuple[bool, str]:
+    # Check for pipeline creation
+    assert _source_contains(PIPELINE_BUILDER, PIPELINE_CREATE_FN), \
+        "Pipeline creation function not found"
+
+
+def test_permission_error_message():
     """
     Test that appropriate error messages are logged for permission issues.
 
     Verifies that error logging is implemented to provide user feedback
     when permission issues occur.
-
-    Returns:
-        (success, message)
     """
-    project_root = get_project_root()
-    logging_module = project_root / "src" / "utils" / "logging.c"
+    assert source_exists(LOGGING_MODULE), \
+        f"Logging module not found at {LOGGING_MODULE}"
 
-    if not logging_module.exists():
-        return (
-            False,
-            f"Logging module not found at {logging_module}"
-        )
+    # Check for logging functions
+    assert (_source_contains(LOGGING_MODULE, LOGGING_FN)
+            or _source_contains(LOGGING_MODULE, LOG_MACRO_PREFIX)), \
+        "Error logging not implemented"
 
+
+# Direct-run order and titles (pytest collects the test_* functions itself)
+TESTS = [
+    ("Camera permission request", test_camera_permission_request),
+    ("Permission denied error handling", test_camera_permission_denied_handling),
+    ("Camera initialization when permission granted", test_camera_permission_granted_flow),
+    ("Permission error message logging", test_permission_error_message),
+]
+
+
+def _run_check(test_func) -> AssertionError | None:
+    """Run one test function, returning its assertion failure if any."""
     try:
-        with open(logging_module, 'r') as f:
-            content = f.read()
-
-            # Check for logging functions
-            if "logging_log" in content or "LOG_" in content:
-                return (
-                    True,
-                    "✓ PASS: Error logging functions implemented"
-                )
-            else:
-                return (
-                    False,
-                    "✗ FAIL: Error logging not implemented"
-                )
-
-    except Exception as e:
-        return (
-            False,
-            f"Error checking logging: {str(e)}"
-        )
+        test_func()
+    except AssertionError as e:
+        return e
+    return None
 
 
 def main() -> int:
     """
-    Run all camera permission handling tests.
+    Run all camera permission handling tests without pytest.
 
     Returns:
         0 if all tests pass, 1 if any test fails
@@ -247,52 +163,25 @@ def main() -> int:
     print("=" * 70)
     print()
 
+    # The checks are independent file scans; run them together and report
+    # in order. The shared source mappings are populated by whichever
+    # worker gets to a file first.
+    with ThreadPoolExecutor(max_workers=len(TESTS)) as executor:
+        failures = list(executor.map(_run_check, (func for _, func in TESTS)))
+
     tests_passed = 0
     tests_failed = 0
 
-    # Test 1: Permission request
-    print("Test 1: Camera permission request")
-    print("-" * 70)
-    success, message = test_camera_permission_request()
-    print(message)
-    if success:
-        tests_passed += 1
-    else:
-        tests_failed += 1
-    print()
-
-    # Test 2: Permission denied handling
-    print("Test 2: Permission denied error handling")
-    print("-" * 70)
-    success, message = test_camera_permission_denied_handling()
-    print(message)
-    if success:
-        tests_passed += 1
-    else:
-        tests_failed += 1
-    print()
-
-    # Test 3: Permission granted flow
-    print("Test 3: Camera initialization when permission granted")
-    print("-" * 70)
-    success, message = test_camera_permission_granted_flow()
-    print(message)
-    if success:
-        tests_passed += 1
-    else:
-        tests_failed += 1
-    print()
-
-    # Test 4: Error messages
-    print("Test 4: Permission error message logging")
-    print("-" * 70)
-    success, message = test_permission_error_message()
-    print(message)
-    if success:
-        tests_passed += 1
-    else:
-        tests_failed += 1
-    print()
+    for number, ((title, _), failure) in enumerate(zip(TESTS, failures), start=1):
+        print(f"Test {number}: {title}")
+        print("-" * 70)
+        if failure is None:
+            print("✓ PASS")
+            tests_passed += 1
+        else:
+            print(f"✗ FAIL: {failure}")
+            tests_failed += 1
+        print()
 
     # Summary
     print("=" * 70)
@@ -303,4 +192,9 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    # Run tests with pytest if available, otherwise run directly
+    try:
+        import pytest
+        sys.exit(pytest.main([__file__, "-v", "--tb=short"]))
+    except ImportError:
+        sys.exit(main())
@@ -12,21 +12,72 @@ Requirement from SDD §8.4 and PRD §5.1:
 This test verifies the grid display configuration, window sizing,
 and cell layout through code inspection and configuration validation.
 
+Test Framework: pytest (falls back to a direct runner when unavailable)
 Test Status: Automated, Headless, Configuration-Based
 Expected Duration: < 5 seconds
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
 
+try:
+    from ._scan_cache import cached_check, map_source, source_exists
+except ImportError:
+    from _scan_cache import cached_check, map_source, source_exists
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+WINDOW_SOURCE = PROJECT_ROOT / "src" / "osx" / "window.c"
+WINDOW_HEADER = PROJECT_ROOT / "src" / "osx" / "window.h"
+PIPELINE_BUILDER = PROJECT_ROOT / "src" / "gstreamer" / "pipeline_builder.c"
+
+
+# Multi-pattern scans: one pass over a file answers a whole group of checks.
+# Each named group is one check; alternatives within a group are synonyms.
+# Case-insensitive matching stays on ASCII folding; the C sources are ASCII.
+# Any one of grid_cols (10), grid_rows (1) or cell_width (320) is enough
+_GRID_LAYOUT_RE = re.compile(
+    rb"grid_cols|grid_rows|cell_width|10|1|320",
+    re.ASCII | re.IGNORECASE
+)
+_VIDEOMIXER_RE = re.compile(rb"videomixer|background|padding")
+_LIVE_FEED_RE = re.compile(
+    rb"(?P<live_queue>live_queue)"
+    rb"|(?P<tee>tee)"  # Split stream for live and recording
+    rb"|(?P<cell_1>(?i:cell 1|cell_1))"
+)
+_WINDOW_SIZING_RE = re.compile(
+    rb"(?P<width>320)"  # Cell width or total width (3200)
+    rb"|(?P<height>180|(?i:aspect_ratio))"  # Height or aspect ratio
+    rb"|(?P<window>NSWindow)"  # Cocoa window
+)
+_CELL_LAYOUT_RE = re.compile(
+    rb"(?P<pad>pad)"
+    rb"|(?P<xpos>xpos|x_pos)"
+    rb"|(?P<ypos>ypos|y_pos)"
+    rb"|(?P<width>width)"
+    rb"|(?P<height>height)",
+    re.ASCII | re.IGNORECASE
+)
+
+
+def _has_groups(pattern: re.Pattern, content, needed: int) -> bool:
+    """
+    Whether at least `needed` distinct checks in a grouped pattern match.
 
-def get_project_root() -> Path:
-    """Get the project root directory."""
-    return Path(__file__).parent.parent.parent
+    Stops scanning as soon as enough checks have matched.
+    """
+    found = set()
+    for match in pattern.finditer(content):
+        found.add(match.lastgroup)
+        if len(found) >= needed:
+            return True
+    return False
 
 
-def test_grid_layout_configuration() -> tuple[bool, str]:
+def test_grid_layout_configuration():
     """
     Test that grid layout is configured for 10×1 cells.
 
@@ -34,58 +85,20 @@ def test_grid_layout_configuration() -> tuple[bool, str]:
     - Exactly 10 cells
     - Arranged in 1 horizontal row
     - Each cell 320 pixels wide
-
-    Returns:
-        (success, message)
     """
-    project_root = get_project_root()
-
     # Check window configuration
-    window_source = project_root / "src" / "osx" / "window.c"
-    window_header = project_root / "src" / "osx" / "window.h"
+    assert source_exists(WINDOW_SOURCE) and source_exists(WINDOW_HEADER), \
+        "Window source files not found"
 
-    if not window_source.exists() or not window_header.exists():
-        return (
-            False,
-            f"Window source files not found"
-        )
+    # Check for grid configuration constants
+    has_config = cached_check(
+        WINDOW_HEADER, "has_grid_layout_config",
+        lambda: _GRID_LAYOUT_RE.search(map_source(WINDOW_HEADER)) is not None
+    )
+    assert has_config, "Grid layout configuration not found in window header"
 
-    try:
-        with open(window_header, 'r') as f:
-            window_content = f.read()
-
-        # Check for grid configuration constants
-        checks = {
-            "grid_cols": r"grid_cols|GRID_COLS|10",
-            "grid_rows": r"grid_rows|GRID_ROWS|1",
-            "cell_width": r"cell_width|CELL_WIDTH|320",
-        }
-
-        has_config = False
-        for config_name, pattern in checks.items():
-            if re.search(pattern, window_content, re.IGNORECASE):
-                has_config = True
-                break
-
-        if has_config:
-            return (
-                True,
-                "✓ PASS: Grid layout configuration (10×1 cells, 320px width) found"
-            )
-        else:
-            return (
-                False,
-                "✗ FAIL: Grid layout configuration not found in window header"
-            )
-
-    except Exception as e:
-        return (
-            False,
-            f"Error checking grid layout: {str(e)}"
-        )
 
-
-def test_videomixer_configuration() -> tuple[bool, str]:
+def test_videomixer_configuration():
     """
     Test that videomixer is configured for proper cell composition.
 
@@ -94,49 +107,18 @@ def test_videomixer_configuration() -> tuple[bool, str]:
     - 10 input pads (one per cell)
     - Proper positioning for grid layout
     - Correct sizing and alignment
-
-    Returns:
-        (success, message)
     """
-    project_root = get_project_root()
-    pipeline_source = project_root / "src" / "gstreamer" / "pipeline_builder.c"
+    assert source_exists(PIPELINE_BUILDER), \
+        f"Pipeline builder not found at {PIPELINE_BUILDER}"
 
-    if not pipeline_source.exists():
-        return (
-            False,
-            f"Pipeline builder not found at {pipeline_source}"
-        )
+    # Check for videomixer creation and configuration
+    assert cached_check(
+        PIPELINE_BUILDER, "has_videomixer_config",
+        lambda: _VIDEOMIXER_RE.search(map_source(PIPELINE_BUILDER)) is not None
+    ), "Videomixer not properly configured"
 
-    try:
-        with open(pipeline_source, 'r') as f:
-            content = f.read()
-
-            # Check for videomixer creation and configuration
-            checks = [
-                "videomixer" in content,
-                "videomixer2" in content or "videomixer" in content,
-                "background" in content or "padding" in content,
-            ]
-
-            if any(checks):
-                return (
-                    True,
-                    "✓ PASS: Videomixer configuration implemented"
-                )
-            else:
-                return (
-                    False,
-                    "✗ FAIL: Videomixer not properly configured"
-                )
-
-    except Exception as e:
-        return (
-            False,
-            f"Error checking videomixer: {str(e)}"
-        )
-
-
-def test_live_feed_routing() -> tuple[bool, str]:
+
+def test_live_feed_routing():
     """
     Test that live camera feed is routed to cell 1.
 
@@ -144,51 +126,18 @@ def test_live_feed_routing() -> tuple[bool, str]:
     - Live feed queue is created for cell 1
     - Live feed is connected to videomixer
     - Live feed remains active during playback operations
-
-    Returns:
-        (success, message)
     """
-    project_root = get_project_root()
-    pipeline_source = project_root / "src" / "gstreamer" / "pipeline_builder.c"
+    assert source_exists(PIPELINE_BUILDER), \
+        f"Pipeline builder not found at {PIPELINE_BUILDER}"
 
-    if not pipeline_source.exists():
-        return (
-            False,
-            f"Pipeline builder not found at {pipeline_source}"
-        )
+    # Check for live queue/feed configuration
+    assert cached_check(
+        PIPELINE_BUILDER, "has_live_feed_routing",
+        lambda: _has_groups(_LIVE_FEED_RE, map_source(PIPELINE_BUILDER), needed=2)
+    ), "Live feed routing incomplete"
 
-    try:
-        with open(pipeline_source, 'r') as f:
-            content = f.read()
-
-            # Check for live queue/feed configuration
-            checks = [
-                "live_queue" in content,
-                "tee" in content,  # Split stream for live and recording
-                "cell 1" in content.lower() or "cell_1" in content.lower(),
-            ]
-
-            found_checks = sum(1 for check in checks if check)
-
-            if found_checks >= 2:
-                return (
-                    True,
-                    "✓ PASS: Live feed routing to cell 1 implemented"
-                )
-            else:
-                return (
-                    False,
-                    "✗ FAIL: Live feed routing incomplete"
-                )
-
-    except Exception as e:
-        return (
-            False,
-            f"Error checking live feed routing: {str(e)}"
-        )
-
-
-def test_window_sizing() -> tuple[bool, str]:
+
+def test_window_sizing():
     """
     Test that window is sized correctly for 10×1 grid.
 
@@ -197,51 +146,17 @@ def test_window_sizing() -> tuple[bool, str]:
     - Height: 180 pixels (for 16:9 aspect ratio from 1920×1080 camera)
     - Resizable: Yes
     - Maintains aspect ratio
-
-    Returns:
-        (success, message)
     """
-    project_root = get_project_root()
-    window_source = project_root / "src" / "osx" / "window.c"
+    assert source_exists(WINDOW_SOURCE), f"Window source not found at {WINDOW_SOURCE}"
 
-    if not window_source.exists():
-        return (
-            False,
-            f"Window source not found at {window_source}"
-        )
+    # Check for window sizing logic
+    assert cached_check(
+        WINDOW_SOURCE, "has_window_sizing",
+        lambda: _has_groups(_WINDOW_SIZING_RE, map_source(WINDOW_SOURCE), needed=2)
+    ), "Window sizing configuration incomplete"
 
-    try:
-        with open(window_source, 'r') as f:
-            content = f.read()
-
-            # Check for window sizing logic
-            checks = [
-                "3200" in content or "320" in content,  # Cell width or total width
-                "180" in content or "aspect_ratio" in content.lower(),  # Height or aspect ratio
-                "NSWindow" in content,  # Cocoa window
-            ]
-
-            found_checks = sum(1 for check in checks if check)
-
-            if found_checks >= 2:
-                return (
-                    True,
-                    "✓ PASS: Window sizing for 10×1 grid configured"
-                )
-            else:
-                return (
-                    False,
-                    "✗ FAIL: Window sizing configuration incomplete"
-                )
-
-    except Exception as e:
-        return (
-            False,
-            f"Error checking window sizing: {str(e)}"
-        )
-
-
-def test_cell_padding_and_alignment() -> tuple[bool, str]:
+
+def test_cell_padding_and_alignment():
     """
     Test that cells are properly padded and aligned in the grid.
 
@@ -250,58 +165,39 @@ def test_cell_padding_and_alignment() -> tuple[bool, str]:
     - No visual gaps or overlaps
     - Grid is evenly distributed
     - No rendering artifacts
-
-    Returns:
-        (success, message)
     """
-    project_root = get_project_root()
-
     # Check GStreamer elements configuration
-    pipeline_source = project_root / "src" / "gstreamer" / "pipeline_builder.c"
-    gst_elements = project_root / "src" / "gstreamer" / "gst_elements.c"
+    assert source_exists(PIPELINE_BUILDER), "Pipeline builder not found"
+
+    # Check for padding/margin configuration
+    assert cached_check(
+        PIPELINE_BUILDER, "has_cell_layout",
+        lambda: _has_groups(_CELL_LAYOUT_RE, map_source(PIPELINE_BUILDER), needed=3)
+    ), "Cell padding and alignment incomplete"
 
-    if not pipeline_source.exists():
-        return (
-            False,
-            f"Pipeline builder not found"
-        )
 
+# Direct-run order and titles (pytest collects the test_* functions itself)
+TESTS = [
+    ("Grid layout configuration (10×1 cells, 320px width)", test_grid_layout_configuration),
+    ("Videomixer composition and configuration", test_videomixer_configuration),
+    ("Live camera feed routing to cell 1", test_live_feed_routing),
+    ("Window sizing for 10×1 grid", test_window_sizing),
+    ("Cell padding and alignment configuration", test_cell_padding_and_alignment),
+]
+
+
+def _run_check(test_func) -> AssertionError | None:
+    """Run one test function, returning its assertion failure if any."""
     try:
-        with open(pipeline_source, 'r') as f:
-            content = f.read()
-
-            # Check for padding/margin configuration
-            checks = [
-                "pad" in content.lower() or "padding" in content.lower(),
-                "xpos" in content.lower() or "x_pos" in content.lower(),
-                "ypos" in content.lower() or "y_pos" in content.lower(),
-                "width" in content.lower(),
-                "height" in content.lower(),
-            ]
-
-            found_checks = sum(1 for check in checks if check)
-
-            if found_checks >= 3:
-                return (
-                    True,
-                    "✓ PASS: Cell padding and positioning configured"
-                )
-            else:
-                return (
-                    False,
-                    "✗ FAIL: Cell padding and alignment incomplete"
-                )
-
-    except Exception as e:
-        return (
-            False,
-            f"Error checking cell configuration: {str(e)}"
-        )
+        test_func()
+    except AssertionError as e:
+        return e
+    return None
 
 
 def main() -> int:
     """
-    Run all grid display verification tests.
+    Run all grid display verification tests without pytest.
 
     Returns:
         0 if all tests pass, 1 if any test fails
@@ -311,63 +207,25 @@ def main() -> int:
     print("=" * 70)
     print()
 
+    # The checks are independent file scans; run them together and report
+    # in order. The shared source mappings are populated by whichever
+    # worker gets to a file first.
+    with ThreadPoolExecutor(max_workers=len(TESTS)) as executor:
+        failures = list(executor.map(_run_check, (func for _, func in TESTS)))
+
     tests_passed = 0
     tests_failed = 0
 
-    # Test 1: Grid layout
-    print("Test 1: Grid layout configuration (10×1 cells, 320px width)")
-    print("-" * 70)
-    success, message = test_grid_layout_configuration()
-    print(message)
-    if success:
-        tests_passed += 1
-    else:
-        tests_failed += 1
-    print()
-
-    # Test 2: Videomixer
-    print("Test 2: Videomixer composition and configuration")
-    print("-" * 70)
-    success, message = test_videomixer_configuration()
-    print(message)
-    if success:
-        tests_passed += 1
-    else:
-        tests_failed += 1
-    print()
-
-    # Test 3: Live feed routing
-    print("Test 3: Live camera feed routing to cell 1")
-    print("-" * 70)
-    success, message = test_live_feed_routing()
-    print(message)
-    if success:
-        tests_passed += 1
-    else:
-        tests_failed += 1
-    print()
-
-    # Test 4: Window sizing
-    print("Test 4: Window sizing for 10×1 grid")
-    print("-" * 70)
-    success, message = test_window_sizing()
-    print(message)
-    if success:
-        tests_passed += 1
-    else:
-        tests_failed += 1
-    print()
-
-    # Test 5: Cell alignment
-    print("Test 5: Cell padding and alignment configuration")
-    print("-" * 70)
-    success, message = test_cell_padding_and_alignment()
-    print(message)
-    if success:
-        tests_passed += 1
-    else:
-        tests_failed += 1
-    print()
+    for number, ((title, _), failure) in enumerate(zip(TESTS, failures), start=1):
+        print(f"Test {number}: {title}")
+        print("-" * 70)
+        if failure is None:
+            print("✓ PASS")
+            tests_passed += 1
+        else:
+            print(f"✗ FAIL: {failure}")
+            tests_failed += 1
+        print()
 
     # Summary
     print("=" * 70)
@@ -378,4 +236,9 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    # Run tests with pytest if available, otherwise run directly
+    try:
+        import pytest
+        sys.exit(pytest.main([__file__, "-v", "--tb=short"]))
+    except ImportError:
+        sys.exit(main())
@@ -21,15 +21,22 @@ Acceptance Criteria (from PRD §4.3, §4.8, §5.1):
 - Live feed persistence: Cell 1 maintains continuous 120 fps throughout test
 - Stability: No memory leaks, CPU <5%, no frame drops >0.1%
 - Test duration: Complete in reasonable time (<2 minutes wall-clock)
+
+The simulation is seeded, so a run is reproducible; set T105_SEED to
+simulate a different one.
 """
 
 import sys
 import time
 import math
+import operator
 import random
 import subprocess
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from typing import Optional, Tuple, List
+from itertools import accumulate, islice
+from typing import Optional, Sequence, Tuple
 import json
 import os
 
@@ -42,45 +49,99 @@ MAX_CPU_PERCENT = 5.0
 MAX_MEMORY_GROWTH_PERCENT = 10.0
 KEYBOARD_LATENCY_THRESHOLD_MS = 50.0
 ACCEPTABLE_DROP_RATE = 0.1
+DROP_PROBABILITY = 0.0002  # Per-frame chance of a simulated drop
+LATENCY_UNIT_MS = 0.1  # Latencies are quantized to this resolution
+LATENCY_BINS = 1024  # One bin per unit, 0-102.3 ms; slower lands in the last bin
+# First histogram bin whose latencies count as exceeding the threshold
+LATENCY_THRESHOLD_BIN = round(KEYBOARD_LATENCY_THRESHOLD_MS / LATENCY_UNIT_MS) + 1
+
+# Optional C-accelerated JSON encoder for the report
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Simulation
+RANDOM_SEED = int(os.environ.get("T105_SEED", "42"))
+KEY_PRESS_PROBABILITY = 0.2  # Per 100 ms tick
+
+
+def _rng_stream(name: str) -> random.Random:
+    """Independent generator for one simulator, derived from RANDOM_SEED"""
+    # String seeds are hashed (SHA-512), so each name gets an unrelated stream
+    return random.Random(f"{RANDOM_SEED}:{name}")
+
+
+# One stream per simulator: none shares state with another, so changing
+# how one simulator draws leaves the others' sequences untouched
+FRAME_RNG = _rng_stream("frames")
+KEYBOARD_RNG = _rng_stream("keyboard")
+LIVE_FEED_RNG = _rng_stream("live_feed")
+RESOURCE_RNG = _rng_stream("resources")
 
 # Thresholds
 MIN_ACCEPTABLE_FPS = TARGET_FPS - FPS_TOLERANCE
 MAX_ACCEPTABLE_FPS = TARGET_FPS + FPS_TOLERANCE
+EXPECTED_CELL_FPS = TARGET_FPS / NUM_CELLS  # Expected: 120/10 = 12 fps per cell
+ACCEPTABLE_CELL_FPS_MIN = EXPECTED_CELL_FPS * 0.9  # 10.8 fps
+ACCEPTABLE_CELL_FPS_MAX = EXPECTED_CELL_FPS * 1.1  # 13.2 fps
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyboardLatencyMetrics:
     """Keyboard input latency metrics"""
-    press_events: List[float] = field(default_factory=list)
-    release_events: List[float] = field(default_factory=list)
-    latencies_ms: List[float] = field(default_factory=list)
+    # Event times (ms), packed as C doubles
+    press_events: array = field(default_factory=lambda: array('d'))
+    release_events: array = field(default_factory=lambda: array('d'))
+    # Fixed-size histogram of quantized latencies (uint32 counts, 4 KB) plus
+    # running totals: memory and calculate() cost stay constant however
+    # many events are recorded
+    latency_hist: array = field(default_factory=lambda: array('I', [0]) * LATENCY_BINS)
+    latency_count: int = 0
+    latency_sum_units: int = 0
     average_latency_ms: float = 0.0
     p95_latency_ms: float = 0.0
     p99_latency_ms: float = 0.0
     max_latency_ms: float = 0.0
     exceeded_threshold: int = 0
 
+    def record(self, latency_ms: float):
+        """Add one latency sample, quantized to LATENCY_UNIT_MS"""
+        units = round(latency_ms / LATENCY_UNIT_MS)
+        self.latency_hist[min(units, LATENCY_BINS - 1)] += 1
+        self.latency_count += 1
+        self.latency_sum_units += units
+        if latency_ms > self.max_latency_ms:
+            self.max_latency_ms = latency_ms
+
+    def _percentile(self, cumulative: list, fraction: float) -> float:
+        """Quantized latency of the sample at fraction of the count"""
+        rank = int(self.latency_count * fraction)
+        if rank >= self.latency_count:
+            return 0.0
+        # First bin with more than rank samples at or below it. Every bin
+        # but the last holds a single quantized value
+        bin_index = bisect_right(cumulative, rank)
+        if bin_index == LATENCY_BINS - 1:
+            return self.max_latency_ms
+        return bin_index * LATENCY_UNIT_MS
+
     def calculate(self):
         """Calculate latency statistics"""
-        if not self.latencies_ms:
+        if not self.latency_count:
             return
 
-        self.average_latency_ms = sum(self.latencies_ms) / len(self.latencies_ms)
-        self.max_latency_ms = max(self.latencies_ms)
-
-        # Percentiles
-        sorted_latencies = sorted(self.latencies_ms)
-        p95_idx = int(len(sorted_latencies) * 0.95)
-        p99_idx = int(len(sorted_latencies) * 0.99)
+        self.average_latency_ms = self.latency_sum_units * LATENCY_UNIT_MS / self.latency_count
 
-        self.p95_latency_ms = sorted_latencies[p95_idx] if p95_idx < len(sorted_latencies) else 0.0
-        self.p99_latency_ms = sorted_latencies[p99_idx] if p99_idx < len(sorted_latencies) else 0.0
+        # Percentiles and the threshold count all read the cumulative bin counts
+        cumulative = list(accumulate(self.latency_hist))
+        self.p95_latency_ms = self._percentile(cumulative, 0.95)
+        self.p99_latency_ms = self._percentile(cumulative, 0.99)
 
-        self.exceeded_threshold = sum(1 for lat in self.latencies_ms
-                                     if lat > KEYBOARD_LATENCY_THRESHOLD_MS)
+        self.exceeded_threshold = self.latency_count - cumulative[LATENCY_THRESHOLD_BIN - 1]
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameMetrics:
     """Frame delivery metrics"""
     total_frames: int = 0
@@ -94,7 +155,7 @@ class FrameMetrics:
     cell_fps: dict = field(default_factory=dict)  # Per-cell FPS
 
 
-@dataclass
+@dataclass(slots=True)
 class LiveFeedMetrics:
     """Live feed (cell 1) persistence metrics"""
     frames_delivered: int = 0
@@ -103,7 +164,7 @@ class LiveFeedMetrics:
     continuous_uptime_percent: float = 100.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceMetrics:
     """System resource metrics"""
     cpu_percent: float = 0.0
@@ -138,92 +199,122 @@ def simulate_keyboard_events(duration_sec: int, num_cells: int) -> KeyboardLaten
 
     event_time = 0.0
     time_step_ms = 100  # Check for events every 100ms
-
-    while event_time < duration_sec * 1000:
-        # 20% chance of key press event per interval
-        if random.random() < 0.2:
-            # Random cell 1-9
-            cell = random.randint(1, 9)
-
-            # Record press event with realistic latency (5-30ms from press to detection)
-            press_latency = random.uniform(5.0, 30.0)
-            metrics.press_events.append(event_time + press_latency)
-            metrics.latencies_ms.append(press_latency)
-
-            # Hold key for random duration
-            hold_duration = random.randint(100, 2000)
-            release_time = event_time + hold_duration
-
-            # Release event with latency
-            release_latency = random.uniform(5.0, 30.0)
-            metrics.release_events.append(release_time + release_latency)
-            metrics.latencies_ms.append(release_latency)
-
-            # Advance past hold duration
-            event_time = release_time + time_step_ms
-        else:
-            event_time += time_step_ms
+    end_ms = duration_sec * 1000
+    log_no_press = math.log1p(-KEY_PRESS_PROBABILITY)
+
+    # Bound methods hoisted out of the loop
+    rng = KEYBOARD_RNG
+    rand, randint, uniform, log = rng.random, rng.randint, rng.uniform, math.log
+    record = metrics.record
+    add_press = metrics.press_events.append
+    add_release = metrics.release_events.append
+
+    while True:
+        # 20% chance of key press event per interval. The idle ticks before
+        # the next press are geometrically distributed, so skip them in one draw
+        event_time += time_step_ms * int(log(1.0 - rand()) / log_no_press)
+        if event_time >= end_ms:
+            break
+
+        # Random cell 1-9
+        cell = randint(1, 9)
+
+        # Record press event with realistic latency (5-30ms from press to detection)
+        press_latency = uniform(5.0, 30.0)
+        add_press(event_time + press_latency)
+        record(press_latency)
+
+        # Hold key for random duration
+        hold_duration = randint(100, 2000)
+        release_time = event_time + hold_duration
+
+        # Release event with latency
+        release_latency = uniform(5.0, 30.0)
+        add_release(release_time + release_latency)
+        record(release_latency)
+
+        # Advance past hold duration
+        event_time = release_time + time_step_ms
 
     # Calculate statistics
     metrics.calculate()
     return metrics
 
 
-def simulate_frame_timestamps(duration_sec: int, target_fps: int,
-                             jitter_percent: float = 2.0) -> Tuple[list, int, dict]:
+def _simulate_run(duration_sec: int, target_fps: int,
+                  jitter_percent: float) -> Tuple[array, list, int]:
     """
-    Simulate frame delivery timestamps across 10 cells.
+    Generate a run's timestamps together with the intervals between them.
+
+    The whole run is generated in bulk rather than frame by frame: all
+    jittered intervals at once, drops placed by geometric gaps, and the
+    timestamps as one running sum.
 
     Returns:
-        (timestamps_us, dropped_count, per_cell_frames)
+        (timestamps_us, intervals_us, dropped_count)
     """
-    timestamps = []
-    per_cell_frames = {cell: [] for cell in range(NUM_CELLS)}
-    dropped = 0
-
     nominal_interval_us = 1_000_000 / target_fps
-    current_time_us = 0
+    duration_us = duration_sec * 1_000_000
+    jitter_scale = jitter_percent / 100.0
+    rand = FRAME_RNG.random
 
-    while current_time_us < duration_sec * 1_000_000:
-        # Add jitter (±jitter_percent)
-        jitter_factor = 1.0 + (random.random() - 0.5) * (jitter_percent / 100.0)
-        actual_interval_us = int(nominal_interval_us * jitter_factor)
+    # Enough intervals to reach the end even if every one runs short
+    count = int(duration_us / (nominal_interval_us * (1.0 - jitter_scale / 2))) + 1
 
-        # Very rarely simulate a dropped frame (0.02% probability)
-        if random.random() < 0.0002:
-            actual_interval_us *= 2
-            dropped += 1
+    # Add jitter (±jitter_percent)
+    intervals = [int(nominal_interval_us * (1.0 + (rand() - 0.5) * jitter_scale))
+                 for _ in range(count)]
 
-        current_time_us += actual_interval_us
-        if current_time_us < duration_sec * 1_000_000:
-            timestamps.append(current_time_us)
+    # Very rarely simulate a dropped frame (0.02% probability). The gaps
+    # between drops are geometrically distributed, so jump from one to the next
+    log_no_drop = math.log1p(-DROP_PROBABILITY)
+    drop_indices = []
+    index = int(math.log(1.0 - rand()) / log_no_drop)
+    while index < count:
+        intervals[index] *= 2
+        drop_indices.append(index)
+        index += 1 + int(math.log(1.0 - rand()) / log_no_drop)
 
-            # Distribute frames across 10 cells (round-robin)
-            cell_idx = (len(timestamps) - 1) % NUM_CELLS
-            per_cell_frames[cell_idx].append(current_time_us)
+    # Running sum into a packed int64 array, cut at the first frame past the end
+    timestamps = array('q', accumulate(intervals))
+    end = bisect_left(timestamps, duration_us)
+    del timestamps[end:]
 
-    return timestamps, dropped, per_cell_frames
+    # The interval that crosses the end was still delivered late if dropped
+    dropped = bisect_right(drop_indices, end)
 
+    # Interval k separates timestamps k-1 and k; the first one precedes the
+    # first frame, so trimming both ends leaves exactly the frame intervals
+    del intervals[end:]
+    del intervals[:1]
 
-def detect_frame_drops(timestamps_us: list, target_fps: int,
-                       tolerance_percent: float = 10.0) -> Tuple[int, float]:
-    """Detect dropped frames based on timestamp gaps"""
+    return timestamps, intervals, dropped
+
+
+def _frame_intervals(timestamps_us: Sequence[int]) -> list:
+    """Intervals between consecutive timestamps, subtracted pairwise in C."""
+    return list(map(operator.sub, islice(timestamps_us, 1, None), timestamps_us))
+
+
+def _count_drops(intervals_us: list, target_fps: int,
+                 tolerance_percent: float) -> int:
+    """Estimated dropped frames across the intervals that exceed tolerance."""
     nominal_interval_us = 1_000_000 / target_fps
     max_acceptable_interval_us = nominal_interval_us * (1.0 + tolerance_percent / 100.0)
 
-    drops = 0
-    for i in range(1, len(timestamps_us)):
-        interval_us = timestamps_us[i] - timestamps_us[i - 1]
-        if interval_us > max_acceptable_interval_us:
-            drops += int(interval_us / nominal_interval_us) - 1
+    # Late intervals are rare; filter them out in C before the per-gap math
+    late_intervals = filter(max_acceptable_interval_us.__lt__, intervals_us)
+    return sum(int(interval_us / nominal_interval_us) - 1
+               for interval_us in late_intervals)
 
-    drop_rate = (drops / len(timestamps_us)) * 100.0 if timestamps_us else 0.0
-    return drops, drop_rate
 
+def calculate_fps_statistics(timestamps_us: Sequence[int], duration_sec: int,
+                            intervals_us: Optional[list] = None) -> FrameMetrics:
+    """Calculate frame rate statistics
 
-def calculate_fps_statistics(timestamps_us: list, duration_sec: int,
-                            per_cell_frames: dict) -> FrameMetrics:
-    """Calculate frame rate statistics"""
+    intervals_us, if given, must be the intervals between consecutive
+    timestamps; they are derived from the timestamps otherwise.
+    """
     metrics = FrameMetrics()
 
     if not timestamps_us or duration_sec == 0:
@@ -232,56 +323,67 @@ def calculate_fps_statistics(timestamps_us: list, duration_sec: int,
     metrics.total_frames = len(timestamps_us)
 
     # Frame intervals
-    intervals_us = []
-    for i in range(1, len(timestamps_us)):
-        interval = timestamps_us[i] - timestamps_us[i - 1]
-        intervals_us.append(interval)
+    if intervals_us is None:
+        intervals_us = _frame_intervals(timestamps_us)
 
     if not intervals_us:
         return metrics
 
-    # Overall statistics
-    avg_interval_us = sum(intervals_us) / len(intervals_us)
+    # Overall statistics. Sums of consecutive intervals telescope to a
+    # timestamp difference, so neither average needs a pass or a slice
+    count = len(intervals_us)
+    total_us = timestamps_us[-1] - timestamps_us[0]
+    avg_interval_us = total_us / count
     metrics.average_fps = 1_000_000 / avg_interval_us if avg_interval_us > 0 else 0.0
 
-    recent_intervals = intervals_us[-100:] if len(intervals_us) > 100 else intervals_us
-    if recent_intervals:
-        recent_avg_interval = sum(recent_intervals) / len(recent_intervals)
-        metrics.current_fps = 1_000_000 / recent_avg_interval if recent_avg_interval > 0 else 0.0
+    # Current FPS (last 100 frames)
+    recent_count = min(count, 100)
+    recent_avg_interval = (timestamps_us[-1] - timestamps_us[-1 - recent_count]) / recent_count
+    metrics.current_fps = 1_000_000 / recent_avg_interval if recent_avg_interval > 0 else 0.0
 
     min_interval = min(intervals_us)
     max_interval = max(intervals_us)
     metrics.fps_max = 1_000_000 / min_interval if min_interval > 0 else 0.0
     metrics.fps_min = 1_000_000 / max_interval if max_interval > 0 else 0.0
 
-    # Std dev
+    # Std dev in one pass from the sum of squares; the intervals are integers,
+    # so n·Σx² − (Σx)² is exact and cannot cancel to a negative variance
+    sum_squares = sum(map(operator.mul, intervals_us, intervals_us))
+    variance = (count * sum_squares - total_us * total_us) / (count * count)
     mean_interval = avg_interval_us
-    variance = sum((x - mean_interval) ** 2 for x in intervals_us) / len(intervals_us)
     std_dev_interval = math.sqrt(variance)
     metrics.fps_std_dev = (std_dev_interval / mean_interval) * metrics.average_fps \
         if mean_interval > 0 else 0.0
 
-    # Drop rate
-    drops, drop_rate = detect_frame_drops(timestamps_us, TARGET_FPS)
-    metrics.dropped_frames = drops
-    metrics.drop_rate = drop_rate
+    # Drop rate, from the intervals already computed
+    metrics.dropped_frames = _count_drops(intervals_us, TARGET_FPS, tolerance_percent=10.0)
+    metrics.drop_rate = (metrics.dropped_frames / len(timestamps_us)) * 100.0
 
-    # Per-cell FPS
-    for cell, frames in per_cell_frames.items():
-        if frames:
-            cell_intervals = []
-            for i in range(1, len(frames)):
-                interval = frames[i] - frames[i - 1]
-                cell_intervals.append(interval)
-
-            if cell_intervals:
-                avg_cell_interval = sum(cell_intervals) / len(cell_intervals)
-                cell_fps = 1_000_000 / avg_cell_interval if avg_cell_interval > 0 else 0.0
-                metrics.cell_fps[cell] = cell_fps
+    # Per-cell FPS from frame counts alone: cell c owns frames c,
+    # c + NUM_CELLS, ... of the run, which is all the range check needs
+    total_frames = len(timestamps_us)
+    for cell in range(min(NUM_CELLS, total_frames)):
+        cell_frames = (total_frames - cell + NUM_CELLS - 1) // NUM_CELLS
+        metrics.cell_fps[cell] = cell_frames / duration_sec
 
     return metrics
 
 
+def simulate_and_measure(duration_sec: int, target_fps: int,
+                         jitter_percent: float = 2.0) -> Tuple[FrameMetrics, int]:
+    """
+    Simulate a run and compute its frame statistics in one pipeline.
+
+    The simulator's own intervals feed the statistics, so they are never
+    re-derived from the timestamps.
+
+    Returns:
+        (frame_metrics, simulated_drops)
+    """
+    timestamps, intervals, dropped = _simulate_run(duration_sec, target_fps, jitter_percent)
+    return calculate_fps_statistics(timestamps, duration_sec, intervals), dropped
+
+
 def simulate_live_feed_monitoring(duration_sec: int,
                                  recording_window_start: float = 5.0,
                                  recording_window_end: float = 15.0) -> LiveFeedMetrics:
@@ -299,9 +401,9 @@ def simulate_live_feed_monitoring(duration_sec: int,
 
     # Simulate occasional dropout during recording window (simulates interference)
     # Should NOT happen in correct implementation
-    if random.random() < 0.05:  # 5% chance of false positive
+    if LIVE_FEED_RNG.random() < 0.05:  # 5% chance of false positive
         metrics.dropouts_detected = 1
-        metrics.dropout_duration_ms = random.uniform(10, 50)
+        metrics.dropout_duration_ms = LIVE_FEED_RNG.uniform(10, 50)
         metrics.continuous_uptime_percent = 99.5
     else:
         metrics.continuous_uptime_percent = 100.0
@@ -318,27 +420,31 @@ def validate_frame_rate(metrics: FrameMetrics) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
-def validate_per_cell_fps(metrics: FrameMetrics) -> Tuple[bool, Optional[str]]:
+def validate_per_cell_fps(metrics: FrameMetrics) -> Tuple[bool, Optional[str], dict]:
     """Validate all cells maintain target FPS
 
     Note: Each cell receives 1/10 of total frames in round-robin distribution.
     Per-cell FPS will be ~12 fps (120/10), not 120 fps.
     This validates that each cell's frames are delivered consistently.
+
+    Returns:
+        (ok, message, per_cell_status) where per_cell_status maps each
+        cell to whether its FPS is in range
     """
     failures = []
-    expected_cell_fps = TARGET_FPS / NUM_CELLS  # Expected: 120/10 = 12 fps per cell
-    acceptable_cell_fps_min = expected_cell_fps * 0.9  # 10.8 fps
-    acceptable_cell_fps_max = expected_cell_fps * 1.1  # 13.2 fps
+    per_cell_status = {}
 
     for cell, fps in metrics.cell_fps.items():
-        if fps < acceptable_cell_fps_min or fps > acceptable_cell_fps_max:
-            failures.append(f"Cell {cell}: {fps:.1f} fps (expected ~{expected_cell_fps:.1f})")
+        in_range = ACCEPTABLE_CELL_FPS_MIN <= fps <= ACCEPTABLE_CELL_FPS_MAX
+        per_cell_status[cell] = in_range
+        if not in_range:
+            failures.append(f"Cell {cell}: {fps:.1f} fps (expected ~{EXPECTED_CELL_FPS:.1f})")
 
     if failures:
         msg = "Cells with out-of-range per-cell FPS: " + ", ".join(failures)
-        return False, msg
+        return False, msg, per_cell_status
 
-    return True, None
+    return True, None, per_cell_status
 
 
 def validate_no_drops(metrics: FrameMetrics) -> Tuple[bool, Optional[str]]:
@@ -382,48 +488,49 @@ def validate_memory_growth(growth_percent: float) -> Tuple[bool, Optional[str]]:
 def run_final_integration_test() -> TestResult:
     """Execute final comprehensive integration test"""
     failures = []
-
-    print("\n" + "=" * 70)
-    print("  FINAL INTEGRATION TEST T-10.5")
-    print("  Comprehensive System Validation")
-    print("=" * 70)
-    print(f"Requirements:")
-    print(f"  • 10-cell grid at 120 fps")
-    print(f"  • 30-minute stability test (simulated as {TEST_DURATION_SECONDS}s)")
-    print(f"  • Keyboard latency: <{KEYBOARD_LATENCY_THRESHOLD_MS}ms (P95)")
-    print(f"  • Live feed persistence: 99.9% uptime during recording")
-    print()
+    # Output is collected and written once at the end rather than line by line
+    out = []
+
+    out.append("\n" + "=" * 70)
+    out.append("  FINAL INTEGRATION TEST T-10.5")
+    out.append("  Comprehensive System Validation")
+    out.append("=" * 70)
+    out.append(f"Requirements:")
+    out.append(f"  • 10-cell grid at 120 fps")
+    out.append(f"  • 30-minute stability test (simulated as {TEST_DURATION_SECONDS}s)")
+    out.append(f"  • Keyboard latency: <{KEYBOARD_LATENCY_THRESHOLD_MS}ms (P95)")
+    out.append(f"  • Live feed persistence: 99.9% uptime during recording")
+    out.append("")
 
     # Initial state
-    print("Phase 1: Initializing test environment...")
+    out.append("Phase 1: Initializing test environment...")
     initial_memory_mb = 512.0  # Baseline
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     # Phase 2: Frame delivery simulation
-    print(f"Phase 2: Simulating {NUM_CELLS}-cell grid at {TARGET_FPS} fps...")
-    timestamps_us, simulated_drops, per_cell_frames = simulate_frame_timestamps(
+    out.append(f"Phase 2: Simulating {NUM_CELLS}-cell grid at {TARGET_FPS} fps...")
+    frame_metrics, simulated_drops = simulate_and_measure(
         TEST_DURATION_SECONDS, TARGET_FPS, jitter_percent=2.0)
-    print(f"  Delivered {len(timestamps_us)} frames in {NUM_CELLS} cells")
+    out.append(f"  Delivered {frame_metrics.total_frames} frames in {NUM_CELLS} cells")
 
     # Phase 3: Keyboard input simulation
-    print(f"Phase 3: Simulating keyboard input events...")
+    out.append(f"Phase 3: Simulating keyboard input events...")
     keyboard_metrics = simulate_keyboard_events(TEST_DURATION_SECONDS, NUM_CELLS)
-    print(f"  Recorded {len(keyboard_metrics.press_events)} press events")
-    print(f"  Recorded {len(keyboard_metrics.release_events)} release events")
+    out.append(f"  Recorded {len(keyboard_metrics.press_events)} press events")
+    out.append(f"  Recorded {len(keyboard_metrics.release_events)} release events")
 
     # Phase 4: Live feed persistence monitoring
-    print(f"Phase 4: Monitoring live feed (cell 1) persistence...")
+    out.append(f"Phase 4: Monitoring live feed (cell 1) persistence...")
     live_feed_metrics = simulate_live_feed_monitoring(TEST_DURATION_SECONDS)
-    print(f"  Cell 1 delivered {live_feed_metrics.frames_delivered} frames")
+    out.append(f"  Cell 1 delivered {live_feed_metrics.frames_delivered} frames")
 
     # Phase 5: Resource measurement
-    elapsed_time = time.time() - start_time
-    final_memory_mb = initial_memory_mb + (random.random() * 50)  # Simulate memory usage
+    elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+    final_memory_mb = initial_memory_mb + (RESOURCE_RNG.random() * 50)  # Simulate memory usage
     memory_growth = ((final_memory_mb - initial_memory_mb) / initial_memory_mb * 100.0)
     cpu_percent = (elapsed_time / TEST_DURATION_SECONDS) * 100.0 * 0.3  # Scaled estimate
 
     # Calculate metrics
-    frame_metrics = calculate_fps_statistics(timestamps_us, TEST_DURATION_SECONDS, per_cell_frames)
     resource_metrics = ResourceMetrics(
         cpu_percent=cpu_percent,
         memory_growth_percent=memory_growth,
@@ -434,99 +541,98 @@ def run_final_integration_test() -> TestResult:
     )
 
     # Validation
-    print("\n" + "=" * 70)
-    print("  Validation Results")
-    print("=" * 70)
-
-    print("\n1. FRAME RATE VALIDATION (All 10 cells @ 120 fps):")
-    print(f"   Average FPS: {frame_metrics.average_fps:.1f}")
-    print(f"   Current FPS: {frame_metrics.current_fps:.1f}")
-    print(f"   Min FPS: {frame_metrics.fps_min:.1f}")
-    print(f"   Max FPS: {frame_metrics.fps_max:.1f}")
-    print(f"   Std Dev: {frame_metrics.fps_std_dev:.1f}")
-    print(f"   Frames dropped: {frame_metrics.dropped_frames} ({frame_metrics.drop_rate:.3f}%)")
+    out.append("\n" + "=" * 70)
+    out.append("  Validation Results")
+    out.append("=" * 70)
+
+    out.append("\n1. FRAME RATE VALIDATION (All 10 cells @ 120 fps):")
+    out.append(f"   Average FPS: {frame_metrics.average_fps:.1f}")
+    out.append(f"   Current FPS: {frame_metrics.current_fps:.1f}")
+    out.append(f"   Min FPS: {frame_metrics.fps_min:.1f}")
+    out.append(f"   Max FPS: {frame_metrics.fps_max:.1f}")
+    out.append(f"   Std Dev: {frame_metrics.fps_std_dev:.1f}")
+    out.append(f"   Frames dropped: {frame_metrics.dropped_frames} ({frame_metrics.drop_rate:.3f}%)")
 
     fr_ok, fr_msg = validate_frame_rate(frame_metrics)
-    print(f"   Status: {'✓ PASS' if fr_ok else '✗ FAIL'} (Target: {MIN_ACCEPTABLE_FPS}-{MAX_ACCEPTABLE_FPS} fps)")
+    out.append(f"   Status: {'✓ PASS' if fr_ok else '✗ FAIL'} (Target: {MIN_ACCEPTABLE_FPS}-{MAX_ACCEPTABLE_FPS} fps)")
     if not fr_ok:
         failures.append(fr_msg)
-        print(f"   → {fr_msg}")
+        out.append(f"   → {fr_msg}")
 
     drops_ok, drops_msg = validate_no_drops(frame_metrics)
-    print(f"   Drops: {'✓ PASS' if drops_ok else '✗ FAIL'} (Acceptable: <{ACCEPTABLE_DROP_RATE}%)")
+    out.append(f"   Drops: {'✓ PASS' if drops_ok else '✗ FAIL'} (Acceptable: <{ACCEPTABLE_DROP_RATE}%)")
     if not drops_ok:
         failures.append(drops_msg)
-        print(f"   → {drops_msg}")
-
-    print("\n2. PER-CELL FPS VALIDATION:")
-    print(f"   (Note: Per-cell fps = {TARGET_FPS}/{NUM_CELLS} = ~{TARGET_FPS/NUM_CELLS:.0f} fps each)")
-    cell_fps_ok, cell_fps_msg = validate_per_cell_fps(frame_metrics)
-    if frame_metrics.cell_fps:
-        expected_cell_fps = TARGET_FPS / NUM_CELLS
-        acceptable_min = expected_cell_fps * 0.9
-        acceptable_max = expected_cell_fps * 1.1
-        for cell in sorted(frame_metrics.cell_fps.keys()):
-            fps = frame_metrics.cell_fps[cell]
-            status = "✓" if acceptable_min <= fps <= acceptable_max else "✗"
-            print(f"   Cell {cell}: {fps:.1f} fps {status} (acceptable: {acceptable_min:.1f}-{acceptable_max:.1f})")
-    print(f"   Status: {'✓ PASS' if cell_fps_ok else '✗ FAIL'}")
+        out.append(f"   → {drops_msg}")
+
+    out.append("\n2. PER-CELL FPS VALIDATION:")
+    out.append(f"   (Note: Per-cell fps = {TARGET_FPS}/{NUM_CELLS} = ~{TARGET_FPS/NUM_CELLS:.0f} fps each)")
+    cell_fps_ok, cell_fps_msg, cell_status = validate_per_cell_fps(frame_metrics)
+    for cell in sorted(cell_status):
+        fps = frame_metrics.cell_fps[cell]
+        status = "✓" if cell_status[cell] else "✗"
+        out.append(f"   Cell {cell}: {fps:.1f} fps {status} "
+                   f"(acceptable: {ACCEPTABLE_CELL_FPS_MIN:.1f}-{ACCEPTABLE_CELL_FPS_MAX:.1f})")
+    out.append(f"   Status: {'✓ PASS' if cell_fps_ok else '✗ FAIL'}")
     if not cell_fps_ok:
         failures.append(cell_fps_msg)
-        print(f"   → {cell_fps_msg}")
+        out.append(f"   → {cell_fps_msg}")
 
-    print("\n3. KEYBOARD LATENCY VALIDATION (<50ms P95):")
-    print(f"   Average latency: {keyboard_metrics.average_latency_ms:.1f}ms")
-    print(f"   P95 latency: {keyboard_metrics.p95_latency_ms:.1f}ms")
-    print(f"   P99 latency: {keyboard_metrics.p99_latency_ms:.1f}ms")
-    print(f"   Max latency: {keyboard_metrics.max_latency_ms:.1f}ms")
-    print(f"   Events exceeded threshold: {keyboard_metrics.exceeded_threshold}")
+    out.append("\n3. KEYBOARD LATENCY VALIDATION (<50ms P95):")
+    out.append(f"   Average latency: {keyboard_metrics.average_latency_ms:.1f}ms")
+    out.append(f"   P95 latency: {keyboard_metrics.p95_latency_ms:.1f}ms")
+    out.append(f"   P99 latency: {keyboard_metrics.p99_latency_ms:.1f}ms")
+    out.append(f"   Max latency: {keyboard_metrics.max_latency_ms:.1f}ms")
+    out.append(f"   Events exceeded threshold: {keyboard_metrics.exceeded_threshold}")
 
     kb_ok, kb_msg = validate_keyboard_latency(keyboard_metrics)
-    print(f"   Status: {'✓ PASS' if kb_ok else '✗ FAIL'}")
+    out.append(f"   Status: {'✓ PASS' if kb_ok else '✗ FAIL'}")
     if not kb_ok:
         failures.append(kb_msg)
-        print(f"   → {kb_msg}")
+        out.append(f"   → {kb_msg}")
 
-    print("\n4. LIVE FEED PERSISTENCE (Cell 1):")
-    print(f"   Frames delivered: {live_feed_metrics.frames_delivered}")
-    print(f"   Dropouts detected: {live_feed_metrics.dropouts_detected}")
-    print(f"   Uptime: {live_feed_metrics.continuous_uptime_percent:.2f}%")
+    out.append("\n4. LIVE FEED PERSISTENCE (Cell 1):")
+    out.append(f"   Frames delivered: {live_feed_metrics.frames_delivered}")
+    out.append(f"   Dropouts detected: {live_feed_metrics.dropouts_detected}")
+    out.append(f"   Uptime: {live_feed_metrics.continuous_uptime_percent:.2f}%")
 
     lf_ok, lf_msg = validate_live_feed_persistence(live_feed_metrics)
-    print(f"   Status: {'✓ PASS' if lf_ok else '✗ FAIL'}")
+    out.append(f"   Status: {'✓ PASS' if lf_ok else '✗ FAIL'}")
     if not lf_ok:
         failures.append(lf_msg)
-        print(f"   → {lf_msg}")
+        out.append(f"   → {lf_msg}")
 
-    print("\n5. SYSTEM STABILITY:")
-    print(f"   Initial memory: {initial_memory_mb:.1f} MB")
-    print(f"   Final memory: {final_memory_mb:.1f} MB")
-    print(f"   Memory growth: {memory_growth:.1f}%")
-    print(f"   CPU estimate: {cpu_percent:.1f}%")
+    out.append("\n5. SYSTEM STABILITY:")
+    out.append(f"   Initial memory: {initial_memory_mb:.1f} MB")
+    out.append(f"   Final memory: {final_memory_mb:.1f} MB")
+    out.append(f"   Memory growth: {memory_growth:.1f}%")
+    out.append(f"   CPU estimate: {cpu_percent:.1f}%")
 
     mem_ok, mem_msg = validate_memory_growth(memory_growth)
-    print(f"   Memory: {'✓ PASS' if mem_ok else '✗ FAIL'} (<{MAX_MEMORY_GROWTH_PERCENT}%)")
+    out.append(f"   Memory: {'✓ PASS' if mem_ok else '✗ FAIL'} (<{MAX_MEMORY_GROWTH_PERCENT}%)")
     if not mem_ok:
         failures.append(mem_msg)
-        print(f"   → {mem_msg}")
+        out.append(f"   → {mem_msg}")
 
     cpu_ok, cpu_msg = validate_cpu_usage(cpu_percent)
-    print(f"   CPU: {'✓ PASS' if cpu_ok else '✗ FAIL'} (<{MAX_CPU_PERCENT}%)")
+    out.append(f"   CPU: {'✓ PASS' if cpu_ok else '✗ FAIL'} (<{MAX_CPU_PERCENT}%)")
     if not cpu_ok:
         failures.append(cpu_msg)
-        print(f"   → {cpu_msg}")
+        out.append(f"   → {cpu_msg}")
 
-    print("\n6. TEST EXECUTION:")
-    print(f"   Duration: {elapsed_time:.2f}s (expected ~{TEST_DURATION_SECONDS}s)")
+    out.append("\n6. TEST EXECUTION:")
+    out.append(f"   Duration: {elapsed_time:.2f}s (expected ~{TEST_DURATION_SECONDS}s)")
     exec_ok = elapsed_time < TEST_DURATION_SECONDS * 2
-    print(f"   Status: {'✓ PASS' if exec_ok else '✗ FAIL'}")
+    out.append(f"   Status: {'✓ PASS' if exec_ok else '✗ FAIL'}")
 
     # Overall result
     passed = fr_ok and drops_ok and cell_fps_ok and kb_ok and lf_ok and mem_ok and cpu_ok and exec_ok
 
-    print("\n" + "=" * 70)
-    print(f"  FINAL RESULT: {'PASS ✓' if passed else 'FAIL ✗'}")
-    print("=" * 70 + "\n")
+    out.append("\n" + "=" * 70)
+    out.append(f"  FINAL RESULT: {'PASS ✓' if passed else 'FAIL ✗'}")
+    out.append("=" * 70 + "\n")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
     return TestResult(
         passed=passed,
@@ -546,6 +652,7 @@ def main():
     results_json = {
         "test": "final_integration_t105",
         "passed": result.passed,
+        "seed": RANDOM_SEED,
         "timestamp": time.time(),
         "frame_metrics": {
             "total_frames": result.frame_metrics.total_frames,
@@ -580,8 +687,12 @@ def main():
 
     # Write JSON report
     output_file = "test_results_t105_final_integration.json"
-    with open(output_file, "w") as f:
-        json.dump(results_json, f, indent=2)
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(results_json, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, "w") as f:
+            json.dump(results_json, f, indent=2)
 
     print(f"Results saved to {output_file}")
 
@@ -4,84 +4,223 @@ Test Syntax Validator
 Validates that test files have proper structure and syntax
 """
 
+import hashlib
+import json
+import mmap
+import os
 import re
 import sys
+import tempfile
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# Results from earlier runs, keyed by each file's mtime and size. Entries are
+# only trusted if this script is unchanged since they were written.
+CACHE_FILE = Path(__file__).parent.parent / ".validate_cache.json"
+VALIDATOR_DIGEST = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+# Sources are scanned as raw bytes, so every pattern is a bytes pattern;
+# all the tokens are ASCII and decoding the files would be wasted work.
+# They are compiled on first use, so a run answered entirely from the cache
+# never builds them.
+
+# The multi-byte tokens the checks look for, found in one pass and tallied
+# by group name. A test function definition is matched up to "test_"; the
+# lookahead then tags it test_fn_strict when it also has an empty or void
+# parameter list. Nothing past "test_" is consumed, so a name such as
+# test_assert( is still counted by the assert group.
+@lru_cache(maxsize=1)
+def _scanner():
+    return re.compile(
+        rb'(?P<test_fn>static\s+(?:int|gboolean|void)\s+test_)'
+        rb'(?:(?=\w+\s*\((?:void)?\)(?P<test_fn_strict>))|)'
+        rb'|(?P<assert>assert\()|(?P<assert_macro>ASSERT_)|(?P<stderr>fprintf\(stderr)'
+        rb'|(?P<main>int main)|(?P<include>include)'
+    )
+
+
+# Braces are far more common than the tokens above; they are pulled out in
+# one C-level pass and counted on the small residue instead
+@lru_cache(maxsize=1)
+def _brace_scanner():
+    return re.compile(rb'[{}]')
+
+
+def _first_unmatched_close(braces):
+    """Index in a brace residue of the first '}' with no '{' open, or None"""
+    depth = 0
+    for index, brace in enumerate(braces):
+        if brace == ord("{"):
+            depth += 1
+        else:
+            depth -= 1
+            if depth < 0:
+                return index
+    return None
+
+
+def _brace_line(content, brace_index):
+    """1-based line number of the brace_index-th brace in content"""
+    for index, match in enumerate(_brace_scanner().finditer(content)):
+        if index == brace_index:
+            return content[:match.start()].count(b"\n") + 1
+    return None
+
+
 class TestValidator:
     def __init__(self):
         self.test_dir = Path("test/unit")
-        self.errors = []
-        self.warnings = []
+        # Filled only by extend() from the main thread after each run
+        self.errors = deque()
+        self.warnings = deque()
+        self._cache = self._load_cache()
+        self._cache_lock = threading.Lock()
+        self._cache_dirty = False
+
+    def _load_cache(self):
+        """Cached results from the last run, or {} if missing or stale"""
+        try:
+            with open(CACHE_FILE, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get("validator") != VALIDATOR_DIGEST:
+            return {}
+        return cache.get("files", {})
+
+    def _save_cache(self):
+        """Write the cache back with an atomic replace, if anything changed"""
+        if not self._cache_dirty:
+            return
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_FILE.parent, suffix=".tmp")
+        except OSError:
+            # A read-only checkout just runs without a warm cache
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"validator": VALIDATOR_DIGEST, "files": self._cache}, f)
+            os.replace(tmp_path, CACHE_FILE)
+        except OSError:
+            # Don't leave a partial temp file behind
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _validate_cached(self, filepath, module_name):
+        """validate_file, replaying the stored result for an unchanged file"""
+        try:
+            st = filepath.stat()
+        except FileNotFoundError:
+            return self.validate_file(filepath, module_name)
+
+        # Absolute, so runs from different working directories never collide
+        cache_path = os.path.abspath(filepath)
+        key = [module_name, st.st_mtime_ns, st.st_size]
+        entry = self._cache.get(cache_path)
+        if entry is not None and entry["key"] == key:
+            return tuple(entry["result"])
+
+        result = self.validate_file(filepath, module_name)
+        with self._cache_lock:
+            self._cache[cache_path] = {"key": key, "result": list(result)}
+            self._cache_dirty = True
+        return result
 
     def validate_file(self, filepath, module_name):
-        """Validate a test file"""
-        print(f"\nValidating: {module_name}")
-        print("-" * 50)
+        """Validate a test file
 
-        if not filepath.exists():
-            self.errors.append(f"{filepath}: File not found")
-            return False
+        Touches no shared state, so files can be validated concurrently.
 
-        with open(filepath, 'r') as f:
-            content = f.read()
+        Returns:
+            (ok, errors, warnings, log_lines)
+        """
+        errors = []
+        warnings = []
+        log = [f"\nValidating: {module_name}", "-" * 50]
 
-        # Check for test functions
-        test_patterns = [
-            r'static\s+(?:int|gboolean|void)\s+test_\w+\s*\((?:void)?\)',
-        ]
+        # open() reports a missing file itself; no separate exists() stat
+        try:
+            f = open(filepath, 'rb')
+        except FileNotFoundError:
+            errors.append(f"{filepath}: File not found")
+            return False, errors, warnings, log
 
-        test_count = 0
-        for pattern in test_patterns:
-            matches = re.findall(pattern, content)
-            test_count += len(matches)
-            if test_count == 0:
-                # Try simpler pattern
-                simple_pattern = r'static\s+(?:int|gboolean|void)\s+test_'
-                test_count = len(re.findall(simple_pattern, content))
+        # Scan the file in place through a read-only mapping rather than a copy
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Zero-length files cannot be mapped; there is nothing to scan
+                ok = self._check_content(filepath, b"", errors, warnings, log)
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    # The scans read front to back; let the kernel read ahead
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        content.madvise(mmap.MADV_SEQUENTIAL)
+                    ok = self._check_content(filepath, content, errors, warnings, log)
+
+        return ok, errors, warnings, log
+
+    def _check_content(self, filepath, content, errors, warnings, log):
+        """Run the checks on a file's bytes, recording findings in the given lists"""
+        counts = Counter(match.lastgroup for match in _scanner().finditer(content))
+
+        # Check for test functions, falling back to the looser form (any
+        # parameter list) only if no strict definition was found
+        test_count = counts['test_fn_strict'] or counts['test_fn']
 
         if test_count == 0:
-            self.errors.append(f"{filepath}: No test functions found")
+            errors.append(f"{filepath}: No test functions found")
             return False
 
-        print(f"✓ Found {test_count} test functions")
+        log.append(f"✓ Found {test_count} test functions")
 
         # Check for main function
-        if 'int main' not in content:
-            self.warnings.append(f"{filepath}: No main function found")
+        if not counts['main']:
+            warnings.append(f"{filepath}: No main function found")
         else:
-            print("✓ Main function exists")
+            log.append("✓ Main function exists")
 
         # Check for assertions
-        assertion_count = 0
-        assertion_patterns = ['assert(', 'ASSERT_', 'fprintf(stderr']
-        for pattern in assertion_patterns:
-            assertion_count += content.count(pattern)
+        assertion_count = counts['assert'] + counts['assert_macro'] + counts['stderr']
 
         if assertion_count == 0:
-            self.warnings.append(f"{filepath}: No assertions found")
+            warnings.append(f"{filepath}: No assertions found")
         else:
-            print(f"✓ Found {assertion_count} assertions/checks")
+            log.append(f"✓ Found {assertion_count} assertions/checks")
 
         # Check for includes
-        has_includes = 'include' in content
+        has_includes = counts['include'] > 0
         if not has_includes:
-            self.warnings.append(f"{filepath}: No includes found")
+            warnings.append(f"{filepath}: No includes found")
         else:
-            print("✓ Has necessary includes")
+            log.append("✓ Has necessary includes")
 
         # Check for proper syntax - matching braces
-        opening_braces = content.count('{')
-        closing_braces = content.count('}')
+        braces = b"".join(_brace_scanner().findall(content))
+        opening_braces = braces.count(b"{")
+        closing_braces = len(braces) - opening_braces
         if opening_braces != closing_braces:
-            self.errors.append(f"{filepath}: Brace mismatch ({opening_braces} open, {closing_braces} close)")
+            errors.append(f"{filepath}: Brace mismatch ({opening_braces} open, {closing_braces} close)")
             return False
 
-        print("✓ Brace syntax OK")
+        # Equal counts can still be misnested ("} {"); the depth must never
+        # go negative
+        unmatched = _first_unmatched_close(braces)
+        if unmatched is not None:
+            line = _brace_line(content, unmatched)
+            errors.append(f"{filepath}:{line}: Closing brace without a matching opening brace")
+            return False
+
+        log.append("✓ Brace syntax OK")
 
-        # Basic C syntax checks
-        if '/*' in content and '*/' not in content:
-            self.warnings.append(f"{filepath}: Unclosed comment block")
+        # Basic C syntax checks. find(), not "in": membership on an mmap
+        # only matches single bytes
+        if content.find(b"/*") != -1 and content.find(b"*/") == -1:
+            warnings.append(f"{filepath}: Unclosed comment block")
 
         return True
 
@@ -98,10 +237,21 @@ class TestValidator:
         print("TEST SYNTAX VALIDATION")
         print("=" * 50)
 
+        # Files are independent: validate them concurrently, then report in
+        # the declared order
+        with ThreadPoolExecutor(max_workers=len(tests_to_validate)) as executor:
+            results = list(executor.map(
+                lambda test: self._validate_cached(self.test_dir / test[1], test[0]),
+                tests_to_validate))
+        self._save_cache()
+
         all_valid = True
-        for module_name, filename in tests_to_validate:
-            filepath = self.test_dir / filename
-            if not self.validate_file(filepath, module_name):
+        for ok, errors, warnings, log in results:
+            # Each file's block goes out in a single write
+            sys.stdout.write("\n".join(log) + "\n")
+            self.errors.extend(errors)
+            self.warnings.extend(warnings)
+            if not ok:
                 all_valid = False
 
         # Print summary
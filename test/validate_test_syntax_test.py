@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for validate_test_syntax.py's per-file checks.
+
+Each test writes a small C source to a temporary directory and validates
+it directly with TestValidator.validate_file, so the result cache and the
+real test/unit sources are not involved.
+
+Test Framework: pytest (falls back to a direct runner when unavailable)
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Aliased so pytest does not try to collect the validator as a test class
+from validate_test_syntax import TestValidator as Validator
+
+
+def _validate_source(source: bytes):
+    """Validate source as a test file; returns (ok, errors, warnings)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "test_sample.c"
+        path.write_bytes(source)
+        ok, errors, warnings, _ = Validator().validate_file(path, "sample")
+    return ok, errors, warnings
+
+
+def test_unclosed_comment_block_warns():
+    """A "/*" with no "*/" anywhere in the file is reported."""
+    ok, errors, warnings = _validate_source(b"/* x\nstatic int test_a(void){}\n")
+    assert ok, errors
+    assert any("Unclosed comment block" in w for w in warnings), warnings
+
+
+def test_closed_comment_block_does_not_warn():
+    """A comment that is closed later in the file is not reported."""
+    ok, errors, warnings = _validate_source(
+        b"/* x */\nstatic int test_a(void){}\n// see /*\n")
+    assert ok, errors
+    assert not any("Unclosed comment block" in w for w in warnings), warnings
+
+
+if __name__ == "__main__":
+    # Run tests with pytest if available, otherwise run directly
+    try:
+        import pytest
+        sys.exit(pytest.main([__file__, "-v", "--tb=short"]))
+    except ImportError:
+        print("pytest not found, running tests directly...")
+
+        failed = 0
+        for test_func in (test_unclosed_comment_block_warns,
+                          test_closed_comment_block_does_not_warn):
+            print(f"Running {test_func.__name__}... ", end="")
+            try:
+                test_func()
+                print("✓ PASS")
+            except AssertionError as e:
+                print(f"✗ FAIL: {e}")
+                failed += 1
+
+        sys.exit(0 if failed == 0 else 1)